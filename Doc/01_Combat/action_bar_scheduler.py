@@ -0,0 +1,365 @@
+# -*- coding: utf-8 -*-
+"""
+행동 순서(액션 바) 스케줄러
+턴_시스템_상세기획서 3~5장 규칙 기반, 턴 조작 효과를 증분 반영
+"""
+
+import heapq
+
+# DT_TurnSettings (턴_시스템 부록 C.1)
+MIN_TURN_CYCLE = 1
+MAX_TURN_CYCLE = 7
+BOSS_MAX_TURN_CYCLE = 10
+MIN_SPEED = 1
+MAX_SPEED = 100
+
+# ETurnEffectType (턴_시스템 부록 C.2, 5장)
+EFFECT_HASTE = 'Haste'                       # 턴 주기 -1
+EFFECT_SLOW = 'Slow'                         # 턴 주기 +1
+EFFECT_IMMEDIATE_TRIGGER = 'ImmediateTrigger'  # 카운터 즉시 0
+EFFECT_COUNTER_RESET = 'CounterReset'        # 최대 주기로 되돌림
+EFFECT_QUICKEN = 'Quicken'                   # 카운터 -N
+EFFECT_DELAY = 'Delay'                       # 카운터 +N (최대치 초과 불가)
+EFFECT_STUN = 'Stun'                         # 카운터 정지
+EFFECT_FREEZE = 'Freeze'                     # 카운터 정지
+EFFECT_SPEED_BUFF = 'SpeedBuff'              # 스피드 +N
+EFFECT_SPEED_DEBUFF = 'SpeedDebuff'          # 스피드 -N
+EFFECT_SPEED_LOCK = 'SpeedLock'              # 스피드 변경 불가
+
+# 큐 항목: 정렬 키 (발동 턴, -스피드, 진영, 슬롯, 등록 순번) + (버전, 유닛 ID)
+KEY_SIZE = 5
+
+
+def clamp(value, low, high):
+    """범위 제한"""
+    return max(low, min(high, value))
+
+
+class UnitTurnState:
+    """유닛별 턴 상태 (DT_UnitTurnData + 전투 중 변동값)
+
+    카운터를 매 턴 감소시키는 대신 다음 발동 턴(trigger_turn)을 절대값으로 저장한다.
+    주기/스피드 효과는 만료 턴과 함께 저장하여 임의 턴 시점의 값을 계산할 수 있다.
+    """
+
+    __slots__ = ('unit_id', 'base_cycle', 'base_speed', 'is_ally', 'slot', 'order', 'is_boss',
+                 'trigger_turn', 'stun_until', 'haste_until', 'slow_until',
+                 'speed_bonus', 'speed_bonus_until', 'speed_lock_until', 'version', 'alive')
+
+    def __init__(self, unit_id, base_cycle, base_speed, is_ally, slot, is_boss, order=0):
+        self.unit_id = unit_id
+        self.base_cycle = base_cycle
+        self.base_speed = base_speed
+        self.is_ally = is_ally
+        self.slot = slot
+        self.order = order           # 등록 순번 (슬롯까지 같을 때의 최종 동률 기준)
+        self.is_boss = is_boss
+        self.trigger_turn = 0
+        self.stun_until = 0          # 이 턴까지 카운터 정지 (해당 턴 포함)
+        self.haste_until = None      # None: 효과 없음, 0: 영구, 그 외: 만료 턴 (미포함)
+        self.slow_until = None
+        self.speed_bonus = 0
+        self.speed_bonus_until = None
+        self.speed_lock_until = None
+        self.version = 0
+        self.alive = True
+
+    def max_cycle(self):
+        """최대 주기 제한 (보스 예외)"""
+        return BOSS_MAX_TURN_CYCLE if self.is_boss else MAX_TURN_CYCLE
+
+    def cycle_at(self, turn):
+        """해당 턴 시점의 턴 주기 (가속 + 둔화 = 상쇄)"""
+        cycle = self.base_cycle
+        if self.haste_until is not None and (self.haste_until == 0 or turn < self.haste_until):
+            cycle -= 1
+        if self.slow_until is not None and (self.slow_until == 0 or turn < self.slow_until):
+            cycle += 1
+        return clamp(cycle, MIN_TURN_CYCLE, self.max_cycle())
+
+    def speed_locked_at(self, turn):
+        """해당 턴 시점의 스피드 고정 여부"""
+        return self.speed_lock_until is not None and (self.speed_lock_until == 0 or turn < self.speed_lock_until)
+
+    def speed_at(self, turn):
+        """해당 턴 시점의 스피드"""
+        speed = self.base_speed
+        if self.speed_bonus_until is not None and (self.speed_bonus_until == 0 or turn < self.speed_bonus_until):
+            speed += self.speed_bonus
+        return clamp(speed, MIN_SPEED, MAX_SPEED)
+
+
+class ActionBarScheduler:
+    """액션 바 스케줄러
+
+    (발동 턴, 스피드) 우선순위 큐로 전 유닛의 다음 행동을 관리한다.
+    효과 적용 시 해당 유닛만 재삽입하고 이전 항목은 버전으로 무효화한다 (O(log n)).
+    정렬 기준 (턴_시스템 4.3): 발동 턴 → 스피드 높은 순 → 아군 우선 → UI 슬롯 순서
+    → 등록 순서. 마지막 기준으로 키가 유닛마다 유일하므로 턴 진행과 예측의 순서가 같다.
+    """
+
+    def __init__(self, current_turn=0):
+        self.current_turn = current_turn
+        self.units = {}
+        self.heap = []
+        self._prediction_cache = {}
+        self._next_order = 0
+
+    # ===== 유닛 관리 =====
+
+    def add_unit(self, unit_id, base_cycle=3, base_speed=50, is_ally=True, slot=0,
+                 is_boss=False, counter=None):
+        """유닛 등록 (카운터 미지정 시 최대 주기로 시작)"""
+        unit = UnitTurnState(unit_id, base_cycle, base_speed, is_ally, slot, is_boss, self._next_order)
+        self._next_order += 1
+        unit.base_cycle = clamp(base_cycle, MIN_TURN_CYCLE, unit.max_cycle())
+        if counter is None:
+            counter = unit.base_cycle
+        self.units[unit_id] = unit
+        self._schedule(unit, self.current_turn + max(counter, 1))
+        return unit
+
+    def remove_unit(self, unit_id):
+        """유닛 제거 (사망 등), 큐 항목은 지연 삭제"""
+        unit = self.units.pop(unit_id, None)
+        if unit is not None:
+            unit.alive = False
+            unit.version += 1
+            self._prediction_cache.clear()
+
+    def counter(self, unit_id):
+        """현재 턴 카운터 (UI 표시값)"""
+        unit = self.units[unit_id]
+        return unit.trigger_turn - self.current_turn - self._stun_remaining(unit)
+
+    def cycle(self, unit_id):
+        """현재 턴 주기"""
+        return self.units[unit_id].cycle_at(self.current_turn)
+
+    def speed(self, unit_id):
+        """현재 스피드"""
+        return self.units[unit_id].speed_at(self.current_turn)
+
+    # ===== 내부 =====
+
+    def _stun_remaining(self, unit):
+        return max(0, unit.stun_until - self.current_turn)
+
+    def _key(self, unit, turn):
+        return (turn, -unit.speed_at(turn), 0 if unit.is_ally else 1, unit.slot, unit.order)
+
+    def _schedule(self, unit, trigger_turn):
+        """유닛의 다음 발동 턴 갱신 및 큐 재삽입"""
+        unit.version += 1
+        unit.trigger_turn = trigger_turn
+        heapq.heappush(self.heap, self._key(unit, trigger_turn) + (unit.version, unit.unit_id))
+        self._prediction_cache.clear()
+
+        # 무효 항목이 과도하게 쌓이면 큐 재구성
+        if len(self.heap) > 4 * len(self.units) + 64:
+            self._rebuild()
+
+    def _rebuild(self):
+        self.heap = [self._key(unit, unit.trigger_turn) + (unit.version, unit.unit_id)
+                     for unit in self.units.values()]
+        heapq.heapify(self.heap)
+
+    def _is_valid(self, entry):
+        unit = self.units.get(entry[-1])
+        return unit is not None and unit.version == entry[-2]
+
+    # ===== 턴 진행 =====
+
+    def advance_turn(self):
+        """모래시계 1회 뒤집힘: 턴 +1 후 카운터 0이 된 유닛을 처리 순서대로 반환
+
+        반환된 유닛은 최대 주기로 카운터가 리셋된다 (턴_시스템 1.2 ⑤).
+        행동 중 사망한 유닛은 호출측에서 remove_unit()으로 제외한다.
+        """
+        self.current_turn += 1
+        turn = self.current_turn
+        acting = []
+        while self.heap and self.heap[0][0] <= turn:
+            entry = heapq.heappop(self.heap)
+            if self._is_valid(entry):
+                acting.append(entry[-1])
+        for unit_id in acting:
+            unit = self.units[unit_id]
+            self._schedule(unit, turn + unit.cycle_at(turn))
+        self._prediction_cache.clear()
+        return acting
+
+    # ===== 턴 조작 효과 (턴_시스템 5장) =====
+
+    def apply_effect(self, unit_id, effect_type, value=1, duration=0):
+        """턴 조작 효과 적용
+
+        duration: 지속 턴 수 (0이면 영구). 스턴/빙결은 영구 적용이 없으며 1 이상이어야
+        한다 (0 이하는 무시, 보스는 절반 적용 후 판정). 주기/스피드 효과는 동일 효과
+        중첩 불가 (최신 효과로 갱신). 즉시 발동은 발동한 유닛 ID를 반환하며 호출측에서
+        인텐트를 실행한다.
+        """
+        unit = self.units.get(unit_id)
+        if unit is None:
+            return None
+        turn = self.current_turn
+        until = turn + duration if duration > 0 else 0
+
+        if effect_type in (EFFECT_HASTE, EFFECT_SLOW):
+            if effect_type == EFFECT_HASTE:
+                unit.haste_until = until
+            else:
+                unit.slow_until = until
+            # 카운터는 새 최대 주기를 초과할 수 없음
+            limit = turn + self._stun_remaining(unit) + unit.cycle_at(turn)
+            self._schedule(unit, min(unit.trigger_turn, limit))
+
+        elif effect_type == EFFECT_IMMEDIATE_TRIGGER:
+            # 스턴 중 유닛은 스턴 해제 후 즉시 발동 (턴_시스템 9.3)
+            unit.stun_until = min(unit.stun_until, turn)
+            # 발동 후 카운터가 최대치로 리셋 (공백 발생)
+            self._schedule(unit, turn + unit.cycle_at(turn))
+            return unit_id
+
+        elif effect_type == EFFECT_COUNTER_RESET:
+            self._schedule(unit, turn + self._stun_remaining(unit) + unit.cycle_at(turn))
+
+        elif effect_type in (EFFECT_QUICKEN, EFFECT_DELAY):
+            stun = self._stun_remaining(unit)
+            counter = unit.trigger_turn - turn - stun
+            if effect_type == EFFECT_QUICKEN:
+                counter = max(counter - value, 0)
+            else:
+                counter = min(counter + value, unit.cycle_at(turn))
+            # 카운터 0은 다음 턴 처리 시 발동
+            self._schedule(unit, turn + stun + max(counter, 1))
+
+        elif effect_type in (EFFECT_STUN, EFFECT_FREEZE):
+            if unit.is_boss:
+                duration = duration // 2   # 보스: 지속시간 50% 감소
+            if duration <= 0:
+                return None
+            old_end = max(unit.stun_until, turn)
+            new_end = max(old_end, turn + duration)
+            unit.stun_until = new_end
+            # 해제 시 남은 카운터부터 재개
+            self._schedule(unit, unit.trigger_turn + (new_end - old_end))
+
+        elif effect_type in (EFFECT_SPEED_BUFF, EFFECT_SPEED_DEBUFF):
+            if unit.speed_locked_at(turn):
+                return None
+            unit.speed_bonus = value if effect_type == EFFECT_SPEED_BUFF else -value
+            unit.speed_bonus_until = until
+            self._schedule(unit, unit.trigger_turn)
+
+        elif effect_type == EFFECT_SPEED_LOCK:
+            unit.speed_lock_until = until
+
+        else:
+            raise ValueError(f"알 수 없는 턴 효과: {effect_type}")
+
+        return None
+
+    def remove_effect(self, unit_id, effect_type):
+        """지속 효과 해제 (버프/디버프 해제, 턴_시스템 5.5/7.4)
+
+        스턴/빙결 해제 시 남은 카운터부터 즉시 재개한다.
+        """
+        unit = self.units.get(unit_id)
+        if unit is None:
+            return
+        turn = self.current_turn
+
+        if effect_type in (EFFECT_HASTE, EFFECT_SLOW):
+            if effect_type == EFFECT_HASTE:
+                unit.haste_until = None
+            else:
+                unit.slow_until = None
+            limit = turn + self._stun_remaining(unit) + unit.cycle_at(turn)
+            self._schedule(unit, min(unit.trigger_turn, limit))
+
+        elif effect_type in (EFFECT_STUN, EFFECT_FREEZE):
+            stun = self._stun_remaining(unit)
+            unit.stun_until = min(unit.stun_until, turn)
+            self._schedule(unit, unit.trigger_turn - stun)
+
+        elif effect_type in (EFFECT_SPEED_BUFF, EFFECT_SPEED_DEBUFF):
+            unit.speed_bonus = 0
+            unit.speed_bonus_until = None
+            self._schedule(unit, unit.trigger_turn)
+
+        elif effect_type == EFFECT_SPEED_LOCK:
+            unit.speed_lock_until = None
+
+        else:
+            raise ValueError(f"해제할 수 없는 턴 효과: {effect_type}")
+
+    # ===== 예측 =====
+
+    def _iter_actions(self):
+        """예측 행동을 순서대로 생성 (발동 턴, 유닛 ID, 스피드)
+
+        큐 전체를 복사하지 않고 힙 트리를 보조 힙으로 탐색하며,
+        반환한 유닛의 다음 반복 행동을 보조 힙에 추가한다.
+        """
+        heap = self.heap
+        frontier = []
+        if heap:
+            frontier.append(heap[0][:KEY_SIZE] + (0, 0, heap[0][-1]))
+
+        while frontier:
+            entry = heapq.heappop(frontier)
+            turn, (source, position, unit_id) = entry[0], entry[KEY_SIZE:]
+
+            if source == 0:
+                # 힙 트리 자식 노드 확장 (자식 키 >= 부모 키)
+                for child in (2 * position + 1, 2 * position + 2):
+                    if child < len(heap):
+                        heapq.heappush(frontier, heap[child][:KEY_SIZE] + (0, child, heap[child][-1]))
+                if not self._is_valid(heap[position]):
+                    continue
+
+            yield turn, unit_id, -entry[1]
+
+            # 같은 유닛의 다음 반복 행동
+            unit = self.units[unit_id]
+            next_turn = turn + unit.cycle_at(turn)
+            heapq.heappush(frontier, self._key(unit, next_turn) + (1, 0, unit_id))
+
+    def next_actions(self, count):
+        """다음 count개 행동 예측 ((발동 턴, 유닛 ID), ...)
+
+        현재 상태가 유지된다고 가정하며, 예정된 효과 만료는 반영한다.
+        O(count log count) (무효 항목 제외). 상태가 바뀌지 않으면 캐시에서
+        반환하므로 결과는 수정할 수 없는 튜플이다.
+        """
+        cached = self._prediction_cache.get(count)
+        if cached is not None:
+            return cached
+
+        result = []
+        if count > 0:
+            for turn, unit_id, _ in self._iter_actions():
+                result.append((turn, unit_id))
+                if len(result) >= count:
+                    break
+
+        result = tuple(result)
+        self._prediction_cache[count] = result
+        return result
+
+    def simultaneous_order(self, turn=None):
+        """해당 턴 동시 발동 순서 [(유닛 ID, 스피드, 순서)] (전투_UI 10.1)
+
+        turn 미지정 시 가장 가까운 발동 턴을 사용한다. 반복 주기로 해당 턴에
+        다시 발동하는 유닛도 포함한다.
+        """
+        order = []
+        for action_turn, unit_id, speed in self._iter_actions():
+            if turn is None:
+                turn = action_turn
+            if action_turn > turn:
+                break
+            if action_turn == turn:
+                order.append((unit_id, speed, len(order) + 1))
+        return order
@@ -0,0 +1,583 @@
+# -*- coding: utf-8 -*-
+"""
+기획서 코퍼스 바이너리 캐시 컴파일러/로더
+Markdown 기획서, doc2 초안, create_pdf.py 하드코딩 테이블을 파싱하여
+버전 관리되는 컬럼형 바이너리 파일로 저장하고 mmap으로 무복사 로드
+사용법: python corpus_cache.py [출력 경로]
+"""
+
+import glob
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import time
+from array import array
+
+from spec_parser import parse_markdown, parse_script, parse_code_enums
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+DEFAULT_CACHE_PATH = os.path.join(REPO_ROOT, '.corpus_cache.bin')
+
+# 포맷 정의 (리틀 엔디안)
+MAGIC = b'ADCORPUS'
+FORMAT_VERSION = 2
+# 매직, 버전, 컬럼 수, 코퍼스 해시, 컴파일러 해시, 데이터 체크섬, 디렉터리 오프셋
+HEADER = struct.Struct('<8sII32s32s32sQ')
+DIRECTORY_ENTRY = struct.Struct('<20sc3xII')  # 컬럼명, 타입코드, 오프셋, 원소 수
+ALIGNMENT = 8
+HASH_SIZE = 32
+
+# 파서/컴파일러 소스 (변경 시 캐시 재생성)
+COMPILER_SOURCES = [
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'spec_parser.py'),
+    os.path.abspath(__file__),
+]
+
+# 컬럼 스키마 (이름, 타입코드). 'b'는 바이트열
+TABLE_COLUMNS = [
+    ('src_path', 'I'), ('src_kind', 'B'), ('src_size', 'Q'), ('src_mtime', 'Q'),
+    ('doc_title', 'I'), ('doc_version', 'I'),
+    ('head_source', 'I'), ('head_level', 'B'), ('head_number', 'I'),
+    ('head_title', 'I'), ('head_text', 'I'),
+    ('tbl_heading', 'I'), ('tbl_cell_start', 'I'), ('tbl_rows', 'I'), ('tbl_cols', 'I'),
+    ('cells', 'I'),
+    ('term_heading', 'I'), ('term_name', 'I'), ('term_def', 'I'),
+    ('enum_source', 'I'), ('enum_kind', 'B'), ('enum_name', 'I'), ('enum_field', 'I'),
+    ('enum_value_start', 'I'), ('enum_value_count', 'I'),
+    ('enum_value', 'I'), ('enum_label', 'I'),
+    ('dtype', 'I'),
+]
+COLUMN_TYPES = dict(TABLE_COLUMNS + [('str_offsets', 'I'), ('str_data', 'b'), ('src_hash', 'b')])
+
+# 문자열 풀 ID 컬럼 (로드 시 범위 검사)
+STRING_COLUMNS = ['src_path', 'doc_title', 'doc_version', 'head_number', 'head_title', 'head_text',
+                  'cells', 'term_name', 'term_def', 'enum_name', 'enum_field', 'enum_value',
+                  'enum_label', 'dtype']
+
+# 소스 종류
+SOURCE_SPEC = 0      # Doc/**/*.md
+SOURCE_DRAFT = 1     # doc2/*.txt
+SOURCE_SCRIPT = 2    # Doc/**/create_pdf.py
+
+# 열거형 종류
+ENUM_SCHEMA = 0      # 코드 블록 데이터 스키마 (E 접두사 타입)
+ENUM_TABLE = 1       # 테이블의 데이터 타입 Enum 행 (표시 값 '/' 구분)
+
+TYPE_COLUMN = '데이터 타입'
+DISPLAY_COLUMN = '표시 값'
+TERM_KEYWORD = '용어'
+
+
+def discover_sources(root=REPO_ROOT):
+    """코퍼스 소스 파일 목록 [(상대 경로, 종류)] (정렬됨)"""
+    patterns = [
+        (os.path.join('Doc', '**', '*.md'), SOURCE_SPEC),
+        (os.path.join('doc2', '*.txt'), SOURCE_DRAFT),
+        (os.path.join('Doc', '**', 'create_pdf.py'), SOURCE_SCRIPT),
+    ]
+    sources = []
+    for pattern, kind in patterns:
+        for path in glob.glob(os.path.join(root, pattern), recursive=True):
+            sources.append((os.path.relpath(path, root).replace(os.sep, '/'), kind))
+    return sorted(sources)
+
+
+def file_digest(path):
+    """파일 SHA-256"""
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).digest()
+
+
+def compiler_digest():
+    """파서/컴파일러 소스 해시 (파싱 규칙 변경 감지)"""
+    digest = hashlib.sha256()
+    for path in COMPILER_SOURCES:
+        digest.update(file_digest(path))
+    return digest.digest()
+
+
+def data_checksum(data):
+    """헤더 이후 데이터 영역 체크섬"""
+    return hashlib.blake2b(data, digest_size=HASH_SIZE).digest()
+
+
+def corpus_digest(sources, hashes):
+    """소스 경로와 해시로 계산한 코퍼스 전체 해시"""
+    digest = hashlib.sha256()
+    for (path, _), file_hash in zip(sources, hashes):
+        digest.update(path.encode('utf-8') + b'\0' + file_hash)
+    return digest.digest()
+
+
+# ===== 컴파일 =====
+
+class StringPool:
+    """중복 제거 문자열 풀 (UTF-8 데이터 + 오프셋 배열)"""
+
+    def __init__(self):
+        self.ids = {}
+        self.offsets = array('I', [0])
+        self.data = bytearray()
+
+    def add(self, text):
+        string_id = self.ids.get(text)
+        if string_id is None:
+            string_id = self.ids[text] = len(self.offsets) - 1
+            self.data += text.encode('utf-8')
+            self.offsets.append(len(self.data))
+        return string_id
+
+
+def strip_markup(text):
+    """강조 표기 제거"""
+    return text.replace('**', '').strip()
+
+
+def collect_columns(root, sources):
+    """소스 파싱 결과를 컬럼 배열로 변환"""
+    pool = StringPool()
+    columns = {name: array(code) for name, code in TABLE_COLUMNS}
+    hashes = []
+    data_types = set()
+
+    for source_index, (path, kind) in enumerate(sources):
+        full_path = os.path.join(root, path)
+        with open(full_path, 'rb') as f:
+            raw = f.read()
+        stat = os.stat(full_path)
+        hashes.append(hashlib.sha256(raw).digest())
+        text = raw.decode('utf-8-sig')
+
+        document = parse_script(text) if kind == SOURCE_SCRIPT else parse_markdown(text)
+        columns['src_path'].append(pool.add(path))
+        columns['src_kind'].append(kind)
+        columns['src_size'].append(stat.st_size)
+        columns['src_mtime'].append(stat.st_mtime_ns)
+        columns['doc_title'].append(pool.add(document['title']))
+        columns['doc_version'].append(pool.add(document['version']))
+
+        # 헤딩 / 테이블 / 용어
+        term_levels = []
+        for section in document['sections']:
+            heading_index = len(columns['head_source'])
+            columns['head_source'].append(source_index)
+            columns['head_level'].append(section['level'])
+            columns['head_number'].append(pool.add(section['number']))
+            columns['head_title'].append(pool.add(section['title']))
+            columns['head_text'].append(pool.add(section['heading']))
+
+            # 용어 섹션 및 그 하위 섹션 판정
+            while term_levels and term_levels[-1] >= section['level']:
+                term_levels.pop()
+            if TERM_KEYWORD in section['title'] and section['level'] > 0:
+                term_levels.append(section['level'])
+
+            for table in section['tables']:
+                header = table['header']
+                columns['tbl_heading'].append(heading_index)
+                columns['tbl_cell_start'].append(len(columns['cells']))
+                columns['tbl_rows'].append(len(table['rows']) + 1)
+                columns['tbl_cols'].append(len(header))
+                for row in [header] + table['rows']:
+                    columns['cells'].extend(pool.add(cell) for cell in row)
+
+                if term_levels and len(header) >= 2:
+                    for row in table['rows']:
+                        if strip_markup(row[0]):
+                            columns['term_heading'].append(heading_index)
+                            columns['term_name'].append(pool.add(strip_markup(row[0])))
+                            columns['term_def'].append(pool.add(strip_markup(row[1])))
+
+                if TYPE_COLUMN in header:
+                    type_col = header.index(TYPE_COLUMN)
+                    display_col = header.index(DISPLAY_COLUMN) if DISPLAY_COLUMN in header else None
+                    for row in table['rows']:
+                        data_types.add(row[type_col])
+                        if row[type_col] == 'Enum' and display_col is not None:
+                            values = [value.strip() for value in row[display_col].split('/')]
+                            add_enum(columns, pool, source_index, ENUM_TABLE, row[0], section['title'],
+                                     [(value, '') for value in values if value])
+
+        # 데이터 스키마 열거형
+        for enum in parse_code_enums(text):
+            add_enum(columns, pool, source_index, ENUM_SCHEMA, enum['name'], enum['field'], enum['values'])
+
+    columns['dtype'].extend(pool.add(name) for name in sorted(data_types) if name)
+    columns['str_offsets'] = pool.offsets
+    columns['str_data'] = pool.data
+    return columns, hashes
+
+
+def add_enum(columns, pool, source_index, kind, name, field, values):
+    columns['enum_source'].append(source_index)
+    columns['enum_kind'].append(kind)
+    columns['enum_name'].append(pool.add(name))
+    columns['enum_field'].append(pool.add(field))
+    columns['enum_value_start'].append(len(columns['enum_value']))
+    columns['enum_value_count'].append(len(values))
+    for value, label in values:
+        columns['enum_value'].append(pool.add(value))
+        columns['enum_label'].append(pool.add(label))
+
+
+def write_cache(root, output_path):
+    """코퍼스를 파싱하여 output_path 옆의 고유 임시 파일에 캐시 작성, 임시 경로 반환"""
+    sources = discover_sources(root)
+    columns, hashes = collect_columns(root, sources)
+    columns['src_hash'] = bytearray(b''.join(hashes))
+
+    body = bytearray()
+    directory = []
+    for name in sorted(columns):
+        column = columns[name]
+        padding = -(HEADER.size + len(body)) % ALIGNMENT
+        body += b'\0' * padding
+        offset = HEADER.size + len(body)
+        if isinstance(column, array):
+            if sys.byteorder != 'little':
+                column = array(column.typecode, column)
+                column.byteswap()
+            typecode, count = column.typecode, len(column)
+            body += column.tobytes()
+        else:
+            typecode, count = 'b', len(column)
+            body += column
+        directory.append(DIRECTORY_ENTRY.pack(name.encode('ascii'), typecode.encode('ascii'),
+                                              offset, count))
+
+    body += b'\0' * (-(HEADER.size + len(body)) % ALIGNMENT)
+    directory_offset = HEADER.size + len(body)
+    body += b''.join(directory)
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, len(directory), corpus_digest(sources, hashes),
+                         compiler_digest(), data_checksum(body), directory_offset)
+
+    # 동시 컴파일 시 서로의 임시 파일을 덮어쓰지 않도록 고유 이름 사용
+    directory_path, name = os.path.split(os.path.abspath(output_path))
+    fd, temp_path = tempfile.mkstemp(prefix=name + '.', suffix='.tmp', dir=directory_path)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(header)
+            f.write(body)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+    return temp_path
+
+
+def compile_corpus(root=REPO_ROOT, output_path=DEFAULT_CACHE_PATH):
+    """코퍼스를 파싱하여 바이너리 캐시 파일 생성 (임시 파일 작성 후 교체)
+
+    다른 프로세스가 캐시를 mmap 중이면 Windows에서 교체가 OSError로 실패한다.
+    """
+    temp_path = write_cache(root, output_path)
+    try:
+        os.replace(temp_path, output_path)
+    except OSError:
+        os.remove(temp_path)
+        raise
+    return output_path
+
+
+# ===== 로드 =====
+
+class CorpusCache:
+    """mmap 기반 코퍼스 캐시 리더
+
+    숫자 컬럼은 memoryview로 직접 참조하며, 문자열은 접근 시에만 디코딩한다.
+    로드 시 포맷/컴파일러 해시, 데이터 체크섬, 컬럼 스키마, 문자열 ID 범위를 검사하고
+    어긋나면 ValueError를 낸다. temporary=True이면 닫을 때 파일을 삭제한다.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, temporary=False):
+        self.path = path
+        self.temporary = temporary
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        self.columns = {}
+        try:
+            self._load_directory()
+        except BaseException:
+            self.close()
+            raise
+
+    def _load_directory(self):
+        try:
+            self._read_directory()
+        except (UnicodeDecodeError, struct.error, KeyError, TypeError) as error:
+            raise ValueError(f"캐시 파일이 손상되었습니다: {self.path} ({error})") from error
+
+    def _read_directory(self):
+        if len(self._view) < HEADER.size:
+            raise ValueError(f"캐시 파일이 손상되었습니다: {self.path}")
+        (magic, version, count, digest, compiler, checksum,
+         directory_offset) = HEADER.unpack_from(self._view, 0)
+        if magic != MAGIC:
+            raise ValueError(f"캐시 파일 형식이 아닙니다: {self.path}")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"캐시 포맷 버전 불일치: {version} (필요: {FORMAT_VERSION})")
+        if compiler != compiler_digest():
+            raise ValueError(f"파서/컴파일러가 변경되었습니다: {self.path}")
+        with self._view[HEADER.size:] as data:
+            if data_checksum(data) != checksum:
+                raise ValueError(f"캐시 체크섬 불일치: {self.path}")
+        if directory_offset + count * DIRECTORY_ENTRY.size > len(self._view):
+            raise ValueError(f"캐시 파일이 손상되었습니다: {self.path}")
+        self.digest = digest
+
+        for index in range(count):
+            raw_name, typecode, offset, length = DIRECTORY_ENTRY.unpack_from(
+                self._view, directory_offset + index * DIRECTORY_ENTRY.size)
+            name = raw_name.rstrip(b'\0').decode('ascii')
+            typecode = typecode.decode('ascii')
+            if COLUMN_TYPES.get(name) != typecode:
+                raise ValueError(f"캐시 컬럼 스키마 불일치: {name} ({typecode})")
+            size = 1 if typecode == 'b' else array(typecode).itemsize
+            if offset + length * size > len(self._view):
+                raise ValueError(f"캐시 컬럼 범위 초과: {name} ({self.path})")
+            if typecode == 'b':
+                self.columns[name] = self._view[offset:offset + length]
+                continue
+            # 중간 슬라이스는 예외 시에도 즉시 해제 (남아 있으면 mmap을 닫을 수 없음)
+            with self._view[offset:offset + length * size] as column:
+                if sys.byteorder == 'little':
+                    self.columns[name] = column.cast(typecode)
+                else:
+                    swapped = array(typecode, column.tobytes())
+                    swapped.byteswap()
+                    self.columns[name] = swapped
+        self._offsets = self.columns['str_offsets']
+        self._data = self.columns['str_data']
+        self._validate()
+
+    def _validate(self):
+        """컬럼 구성, 문자열 ID 범위, 소스 해시 검사"""
+        columns = self.columns
+        missing = sorted(set(COLUMN_TYPES) - set(columns))
+        if missing:
+            raise ValueError(f"캐시 컬럼 누락: {missing} ({self.path})")
+        offsets = self._offsets
+        if not len(offsets) or offsets[-1] != len(self._data):
+            raise ValueError(f"캐시 문자열 풀이 손상되었습니다: {self.path}")
+        string_count = len(offsets) - 1
+        for name in STRING_COLUMNS:
+            if len(columns[name]) and max(columns[name]) >= string_count:
+                raise ValueError(f"캐시 문자열 ID 범위 초과: {name} ({self.path})")
+        if len(columns['src_hash']) != self.source_count() * HASH_SIZE:
+            raise ValueError(f"캐시 소스 해시가 손상되었습니다: {self.path}")
+        sources = [(self.source_path(index), columns['src_kind'][index])
+                   for index in range(self.source_count())]
+        hashes = [self.source_hash(index) for index in range(self.source_count())]
+        if corpus_digest(sources, hashes) != self.digest:
+            raise ValueError(f"캐시 코퍼스 해시 불일치: {self.path}")
+
+    def close(self):
+        """memoryview 해제 후 mmap 닫기 (중복 호출 가능, 임시 캐시는 삭제)"""
+        for column in self.columns.values():
+            if isinstance(column, memoryview):
+                column.release()
+        self.columns = {}
+        self._offsets = self._data = None
+        self._view.release()
+        self._mmap.close()
+        if self.temporary:
+            self.temporary = False
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ===== 기본 접근 =====
+
+    def string(self, string_id):
+        """문자열 풀 조회"""
+        return str(self._data[self._offsets[string_id]:self._offsets[string_id + 1]], 'utf-8')
+
+    def source_count(self):
+        return len(self.columns['src_path'])
+
+    def source_path(self, index):
+        return self.string(self.columns['src_path'][index])
+
+    def source_hash(self, index):
+        return bytes(self.columns['src_hash'][index * HASH_SIZE:(index + 1) * HASH_SIZE])
+
+    def source_index(self, path):
+        """상대 경로로 소스 인덱스 조회 (없으면 None)"""
+        for index in range(self.source_count()):
+            if self.source_path(index) == path:
+                return index
+        return None
+
+    # ===== 신선도 검사 =====
+
+    def check_sources(self, root=REPO_ROOT):
+        """소스 변경 검사 (크기/mtime이 같으면 해시 생략)
+
+        반환값: (내용 일치 여부, mtime만 바뀐 소스 수)
+        """
+        sources = discover_sources(root)
+        if len(sources) != self.source_count():
+            return False, 0
+        columns = self.columns
+        touched = 0
+        for index, (path, kind) in enumerate(sources):
+            if path != self.source_path(index) or kind != columns['src_kind'][index]:
+                return False, 0
+            full_path = os.path.join(root, path)
+            try:
+                stat = os.stat(full_path)
+            except OSError:
+                return False, 0
+            if stat.st_size != columns['src_size'][index]:
+                return False, 0
+            if stat.st_mtime_ns != columns['src_mtime'][index]:
+                if file_digest(full_path) != self.source_hash(index):
+                    return False, 0
+                touched += 1
+        return True, touched
+
+    def is_fresh(self, root=REPO_ROOT):
+        """소스 내용이 캐시와 같은지 여부"""
+        return self.check_sources(root)[0]
+
+    # ===== 코퍼스 조회 =====
+
+    def headings(self, source=None):
+        """헤딩 목록 [{'index', 'source', 'level', 'number', 'title', 'heading'}]"""
+        columns = self.columns
+        result = []
+        for index in range(len(columns['head_source'])):
+            if source is not None and columns['head_source'][index] != source:
+                continue
+            result.append({
+                'index': index,
+                'source': columns['head_source'][index],
+                'level': columns['head_level'][index],
+                'number': self.string(columns['head_number'][index]),
+                'title': self.string(columns['head_title'][index]),
+                'heading': self.string(columns['head_text'][index]),
+            })
+        return result
+
+    def table_count(self):
+        return len(self.columns['tbl_heading'])
+
+    def table(self, index):
+        """테이블 조회 {'heading', 'header', 'rows'}"""
+        columns = self.columns
+        start = columns['tbl_cell_start'][index]
+        row_count = columns['tbl_rows'][index]
+        col_count = columns['tbl_cols'][index]
+        cells = columns['cells']
+        rows = [[self.string(cells[start + r * col_count + c]) for c in range(col_count)]
+                for r in range(row_count)]
+        return {'heading': columns['tbl_heading'][index], 'header': rows[0], 'rows': rows[1:]}
+
+    def document(self, source):
+        """소스 하나를 spec_parser 문서 모델로 복원"""
+        columns = self.columns
+        sections = {}
+        document = {
+            'title': self.string(columns['doc_title'][source]),
+            'version': self.string(columns['doc_version'][source]),
+            'sections': [],
+        }
+        for heading in self.headings(source):
+            section = {key: heading[key] for key in ('level', 'heading', 'number', 'title')}
+            section['tables'] = []
+            sections[heading['index']] = section
+            document['sections'].append(section)
+        for index in range(self.table_count()):
+            section = sections.get(columns['tbl_heading'][index])
+            if section is not None:
+                table = self.table(index)
+                section['tables'].append({'header': table['header'], 'rows': table['rows']})
+        return document
+
+    def terms(self):
+        """용어 목록 [(용어, 정의, 헤딩 인덱스)]"""
+        columns = self.columns
+        return [(self.string(columns['term_name'][i]), self.string(columns['term_def'][i]),
+                 columns['term_heading'][i])
+                for i in range(len(columns['term_name']))]
+
+    def enums(self, kind=None):
+        """열거형 목록 [{'source', 'kind', 'name', 'field', 'values': [(값, 설명)]}]"""
+        columns = self.columns
+        result = []
+        for i in range(len(columns['enum_name'])):
+            if kind is not None and columns['enum_kind'][i] != kind:
+                continue
+            start = columns['enum_value_start'][i]
+            values = [(self.string(columns['enum_value'][j]), self.string(columns['enum_label'][j]))
+                      for j in range(start, start + columns['enum_value_count'][i])]
+            result.append({
+                'source': columns['enum_source'][i],
+                'kind': columns['enum_kind'][i],
+                'name': self.string(columns['enum_name'][i]),
+                'field': self.string(columns['enum_field'][i]),
+                'values': values,
+            })
+        return result
+
+    def data_types(self):
+        """데이터 타입 컬럼의 고유 값 목록"""
+        return [self.string(string_id) for string_id in self.columns['dtype']]
+
+
+def load_corpus(root=REPO_ROOT, cache_path=DEFAULT_CACHE_PATH):
+    """캐시 로드 (없거나, 손상됐거나, 포맷/파서가 다르거나, 소스가 바뀌었으면 재컴파일)
+
+    mtime만 바뀐 경우에도 재컴파일하여 다음 로드부터 해시를 생략한다.
+    다른 프로세스가 캐시를 열고 있어 교체에 실패하면(Windows), 내용이 같은 기존
+    캐시를 그대로 쓰거나 닫을 때 삭제되는 임시 캐시를 만들어 반환한다.
+    """
+    fresh = False
+    if os.path.exists(cache_path):
+        try:
+            cache = CorpusCache(cache_path)
+        except (OSError, ValueError):
+            cache = None
+        if cache is not None:
+            fresh, touched = cache.check_sources(root)
+            if fresh and not touched:
+                return cache
+            cache.close()
+
+    try:
+        compile_corpus(root, cache_path)
+    except OSError:
+        if fresh:
+            return CorpusCache(cache_path)
+        return CorpusCache(write_cache(root, cache_path), temporary=True)
+    return CorpusCache(cache_path)
+
+
+def main(argv):
+    output_path = argv[1] if len(argv) > 1 else DEFAULT_CACHE_PATH
+
+    start = time.perf_counter()
+    compile_corpus(REPO_ROOT, output_path)
+    compiled = time.perf_counter()
+    with load_corpus(REPO_ROOT, output_path) as cache:
+        loaded = time.perf_counter()
+        print(f"소스 {cache.source_count()}개, 헤딩 {len(cache.columns['head_source'])}개, "
+              f"테이블 {cache.table_count()}개, 용어 {len(cache.columns['term_name'])}개, "
+              f"열거형 {len(cache.columns['enum_name'])}개, 데이터 타입 {len(cache.columns['dtype'])}개")
+        print(f"컴파일 {(compiled - start) * 1000:.1f}ms, 로드 {(loaded - compiled) * 1000:.1f}ms")
+    print(f"캐시 생성 완료: {output_path} ({os.path.getsize(output_path):,} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,324 @@
+# -*- coding: utf-8 -*-
+"""
+기획서 버전 간 구조 비교 및 변경 이력 PDF 생성 스크립트
+사용법: python spec_diff.py <이전 버전> <새 버전> [출력 PDF]
+각 버전은 파일 경로 또는 git 리비전 지정(예: HEAD~1:Doc/01_Combat/전투_UI_기획서.md)
+.py 소스는 create_pdf.py 스타일 하드코딩 테이블로 파싱
+"""
+
+import hashlib
+import os
+import re
+import subprocess
+import sys
+import unicodedata
+from xml.sax.saxutils import escape
+
+from spec_parser import parse_markdown, parse_script, iter_tables, key_index
+
+# 변경 유형
+CHANGE_ADDED = '추가'
+CHANGE_REMOVED = '삭제'
+CHANGE_MODIFIED = '변경'
+CHANGE_MOVED = '이동'
+
+CHANGE_ORDER = [CHANGE_ADDED, CHANGE_REMOVED, CHANGE_MODIFIED, CHANGE_MOVED]
+
+# 중요도 비교 시 등급만 사용 (Markdown 아이콘/강조 표기와 create_pdf.py 평문 비교)
+IMPORTANCE_COLUMN = '중요도'
+IMPORTANCE_LEVELS = ['필수', '권장', '선택']
+
+SLASH_RE = re.compile(r'\s*/\s*')
+SPACE_RE = re.compile(r'\s+')
+
+
+def read_source(spec):
+    """파일 경로 또는 git 리비전(REV:PATH)에서 소스 텍스트 읽기"""
+    if os.path.exists(spec):
+        with open(spec, encoding='utf-8') as f:
+            return f.read()
+    output = subprocess.run(['git', 'show', spec], capture_output=True, check=True)
+    return output.stdout.decode('utf-8')
+
+
+def parse_source(spec):
+    """버전 지정을 문서 모델로 변환 (.py는 스크립트, 그 외는 Markdown)"""
+    text = read_source(spec)
+    if spec.endswith('.py'):
+        return parse_script(text)
+    return parse_markdown(text)
+
+
+def normalize_cell(text):
+    """비교용 셀 정규화 (강조 표기/아이콘 제거, '/' 주변 및 연속 공백 정리)
+
+    '✅ **필수**' → '필수', '공격 / 방어' → '공격/방어'
+    """
+    text = text.replace('**', '')
+    text = ''.join(char for char in text
+                   if unicodedata.category(char) != 'So' and char != '\ufe0f')
+    text = SLASH_RE.sub('/', text)
+    return SPACE_RE.sub(' ', text).strip()
+
+
+def row_hash(header, row):
+    """행 해시 (컬럼명 포함, 8바이트)"""
+    payload = '\x1f'.join(f'{name}\x1e{value}' for name, value in zip(header, row))
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=8).digest()
+
+
+def section_paths(document):
+    """섹션별 상위 헤딩 경로 키 {id(섹션): (제목, ...)}
+
+    섹션 번호는 버전 간 재번호될 수 있으므로 제목만 사용한다.
+    같은 경로가 반복되면 경로별 등장 순번을 덧붙여 구분한다.
+    """
+    paths = {}
+    seen = {}
+    stack = []
+    for section in document['sections']:
+        while stack and stack[-1][0] >= section['level']:
+            stack.pop()
+        if section['level'] > 0:
+            stack.append((section['level'], section['title']))
+        path = tuple(title for _, title in stack)
+        occurrence = seen.get(path, 0)
+        seen[path] = occurrence + 1
+        paths[id(section)] = path + ((occurrence,) if occurrence else ())
+    return paths
+
+
+def index_rows(document):
+    """문서의 모든 테이블 행을 (섹션 경로, 키, 순번) 기준으로 색인
+
+    헤더/셀은 normalize_cell로 정규화하여 키, 해시, 비교에 사용하고
+    원문은 'raw'에 보관한다.
+    같은 섹션에 같은 데이터 명이 여러 번 나오면 순번으로 구분한다.
+    """
+    paths = section_paths(document)
+    index = {}
+    occurrences = {}
+    for section, table in iter_tables(document):
+        header = [normalize_cell(name) for name in table['header']]
+        key_col = key_index(header)
+        path = paths[id(section)]
+        for raw in table['rows']:
+            row = [normalize_cell(cell) for cell in raw]
+            name = row[key_col]
+            if not name:
+                continue
+            occurrence = occurrences.get((path, name), 0)
+            occurrences[(path, name)] = occurrence + 1
+            index[(path, name, occurrence)] = {
+                'section': section['heading'],
+                'location': ' > '.join(str(part) for part in path),
+                'title': section['title'],
+                'name': name,
+                'values': dict(zip(header, row)),
+                'raw': dict(zip(header, raw)),
+                'key_column': header[key_col],
+                'hash': row_hash(header, row),
+            }
+    return index
+
+
+def normalize_importance(value):
+    """중요도 등급 추출 ('✅ **필수**' → '필수')"""
+    for level in IMPORTANCE_LEVELS:
+        if level in value:
+            return level
+    return value
+
+
+def diff_fields(old, new):
+    """두 행의 필드별 변경 목록 [(필드, 이전, 이후)] (비교는 정규화 값, 표시는 원문)"""
+    changes = []
+    fields = list(old['values'])
+    fields += [name for name in new['values'] if name not in old['values']]
+    for field in fields:
+        if field == old['key_column']:
+            continue
+        before = old['values'].get(field, '')
+        after = new['values'].get(field, '')
+        if field == IMPORTANCE_COLUMN:
+            changed = normalize_importance(before) != normalize_importance(after)
+        else:
+            changed = before != after
+        if changed:
+            changes.append((field, old['raw'].get(field, ''), new['raw'].get(field, '')))
+    return changes
+
+
+def diff_documents(old_doc, new_doc):
+    """두 문서 모델의 행 단위 변경 목록 생성
+
+    섹션 경로/데이터 명으로 행을 매칭한 뒤, 해시가 같은 행은 필드 비교를 생략한다.
+    매칭되지 않은 행 중 섹션 제목+데이터 명, 또는 데이터 명이 양쪽에 하나씩만
+    남은 경우 섹션 이동으로 본다.
+    반환값: [{'kind', 'section', 'name', 'field', 'old', 'new'}, ...]
+    """
+    old_index = index_rows(old_doc)
+    new_index = index_rows(new_doc)
+    changes = []
+
+    def add_field_changes(old, new, kind=CHANGE_MODIFIED):
+        for field, before, after in diff_fields(old, new):
+            changes.append({'kind': kind, 'section': new['section'], 'name': new['name'],
+                            'field': field, 'old': before, 'new': after})
+
+    # 1차: 같은 섹션 경로/데이터 명 매칭
+    removed = []
+    for key, old in old_index.items():
+        new = new_index.get(key)
+        if new is None:
+            removed.append(old)
+        elif old['hash'] != new['hash']:
+            add_field_changes(old, new)
+    added = [new for key, new in new_index.items() if key not in old_index]
+
+    # 2차: 섹션 이동 판정 (섹션 제목 + 데이터 명, 이후 데이터 명만으로 유일하게 대응될 때)
+    for match_key in (lambda row: (row['title'], row['name']), lambda row: row['name']):
+        removed_groups = {}
+        for old in removed:
+            removed_groups.setdefault(match_key(old), []).append(old)
+        added_groups = {}
+        for new in added:
+            added_groups.setdefault(match_key(new), []).append(new)
+
+        matched = set()
+        for key, olds in removed_groups.items():
+            news = added_groups.get(key, [])
+            if len(olds) == 1 and len(news) == 1:
+                old, new = olds[0], news[0]
+                matched.update((id(old), id(new)))
+                changes.append({'kind': CHANGE_MOVED, 'section': new['section'], 'name': new['name'],
+                                'field': '섹션', 'old': old['location'], 'new': new['location']})
+                if old['hash'] != new['hash']:
+                    add_field_changes(old, new)
+        removed = [old for old in removed if id(old) not in matched]
+        added = [new for new in added if id(new) not in matched]
+
+    for old in removed:
+        changes.append({'kind': CHANGE_REMOVED, 'section': old['section'], 'name': old['name'],
+                        'field': '', 'old': '', 'new': ''})
+    for new in added:
+        changes.append({'kind': CHANGE_ADDED, 'section': new['section'], 'name': new['name'],
+                        'field': '', 'old': '', 'new': ''})
+
+    return changes
+
+
+def summarize_changes(changes):
+    """변경 유형별 행 수 집계 (필드 변경은 행 단위로 한 번만 센다)"""
+    counted = {kind: set() for kind in CHANGE_ORDER}
+    for change in changes:
+        counted[change['kind']].add((change['section'], change['name']))
+    return {kind: len(rows) for kind, rows in counted.items()}
+
+
+def group_by_section(changes):
+    """섹션별 변경 목록 (등장 순서 유지)"""
+    groups = {}
+    for change in changes:
+        groups.setdefault(change['section'], []).append(change)
+    return groups
+
+
+def build_diff_report(old_doc, new_doc, changes, output_path):
+    """변경 이력 PDF 생성 (create_pdf.py 스타일)"""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import cm
+    from reportlab.lib.colors import white
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
+    from create_pdf import (create_styles, create_table, get_importance_text,
+                            FONT_NAME, TABLE_HEADER_BG, HEADER_BG, CREAM_BG)
+
+    doc = SimpleDocTemplate(
+        output_path,
+        pagesize=A4,
+        rightMargin=1.5*cm,
+        leftMargin=1.5*cm,
+        topMargin=2*cm,
+        bottomMargin=2*cm
+    )
+
+    styles = create_styles()
+    story = []
+
+    # ===== 표지 =====
+    title = new_doc['title'] or old_doc['title']
+    story.append(Spacer(1, 3*cm))
+    story.append(Paragraph(f"{escape(title)} 변경 이력", styles['DocTitle']))
+    story.append(Spacer(1, 1*cm))
+    story.append(Paragraph(f"{old_doc['version'] or '이전'} → {new_doc['version'] or '현재'}",
+                           styles['DocSubtitle']))
+
+    # ===== 요약 =====
+    story.append(Spacer(1, 2*cm))
+    story.append(Paragraph("변경 요약", styles['SectionTitle']))
+    summary = summarize_changes(changes)
+    data = [['변경 유형', '행 수']]
+    for kind in CHANGE_ORDER:
+        data.append([kind, str(summary[kind])])
+    summary_table = Table(data, colWidths=[4*cm, 4*cm])
+    summary_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), TABLE_HEADER_BG),
+        ('TEXTCOLOR', (0, 0), (-1, 0), white),
+        ('FONTNAME', (0, 0), (-1, -1), FONT_NAME),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('GRID', (0, 0), (-1, -1), 0.5, HEADER_BG),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+        ('TOPPADDING', (0, 0), (-1, -1), 8),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [white, CREAM_BG]),
+    ]))
+    story.append(summary_table)
+
+    if not changes:
+        story.append(Spacer(1, 0.5*cm))
+        story.append(Paragraph("변경된 데이터가 없습니다.", styles['BodyKorean']))
+
+    # ===== 섹션별 상세 =====
+    if changes:
+        story.append(PageBreak())
+        story.append(Paragraph("섹션별 변경 상세", styles['SectionTitle']))
+
+    for section, section_changes in group_by_section(changes).items():
+        story.append(Paragraph(escape(section) or '(섹션 없음)', styles['SubsectionTitle']))
+        data = [['데이터 명', '변경 유형', '항목', '이전', '이후']]
+        for change in section_changes:
+            before, after = change['old'], change['new']
+            if change['field'] == '중요도':
+                before, after = get_importance_text(before), get_importance_text(after)
+            data.append([change['name'], change['kind'], change['field'], before, after])
+        story.append(create_table(data, col_widths=[3.5*cm, 1.8*cm, 2.2*cm, 5*cm, 5*cm]))
+
+    # PDF 빌드
+    doc.build(story)
+    print(f"PDF 생성 완료: {output_path}")
+    return output_path
+
+
+def main(argv):
+    if len(argv) < 3:
+        print(__doc__)
+        return 1
+
+    old_doc = parse_source(argv[1])
+    new_doc = parse_source(argv[2])
+    changes = diff_documents(old_doc, new_doc)
+
+    if len(argv) > 3:
+        output_path = argv[3]
+    else:
+        output_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "기획서_변경_이력.pdf")
+
+    summary = summarize_changes(changes)
+    print(", ".join(f"{kind} {summary[kind]}" for kind in CHANGE_ORDER))
+    build_diff_report(old_doc, new_doc, changes, output_path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
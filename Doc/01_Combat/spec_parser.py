@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+"""
+기획서 Markdown 파서
+헤딩/테이블 구조를 섹션 모델로 변환 (reportlab 불필요)
+"""
+
+import ast
+import re
+
+HEADING_RE = re.compile(r'^(#{1,6})\s+(.*?)\s*#*\s*$')
+SEPARATOR_RE = re.compile(r'^\|?\s*:?-{2,}:?\s*(\|\s*:?-{2,}:?\s*)*\|?\s*$')
+SECTION_NUMBER_RE = re.compile(r'^(\d+(?:\.\d+)*)\.?\s+')
+VERSION_RE = re.compile(r'^>\s*\*\*버전\*\*\s*:\s*(\S+)')
+SCRIPT_VERSION_RE = re.compile(r'^버전\s*:?\s*(\S+)')
+CELL_SPLIT_RE = re.compile(r'(?<!\\)\|')
+ENUM_FIELD_RE = re.compile(r'[├└]── (\w+)\s*\((E[A-Z]\w*)(?::\s*([^)]*))?\)')
+TREE_ITEM_RE = re.compile(r'[├└]── (\w+)(?:\s*\(([^)]*)\))?')
+
+# 테이블 키 컬럼 (없으면 첫 번째 컬럼 사용)
+KEY_COLUMN = '데이터 명'
+
+
+def split_heading(text):
+    """헤딩 텍스트를 (번호, 제목)으로 분리"""
+    match = SECTION_NUMBER_RE.match(text)
+    if match:
+        return match.group(1), text[match.end():].strip()
+    return '', text.strip()
+
+
+def split_cells(line):
+    """테이블 행을 셀 목록으로 분리 (\\| 이스케이프 및 \\<, \\> 복원)"""
+    line = line.strip()
+    if line.startswith('|'):
+        line = line[1:]
+    if line.endswith('|') and not line.endswith('\\|'):
+        line = line[:-1]
+    cells = CELL_SPLIT_RE.split(line)
+    return [cell.strip().replace('\\|', '|').replace('\\<', '<').replace('\\>', '>')
+            for cell in cells]
+
+
+def new_section(level, heading):
+    """섹션 딕셔너리 생성"""
+    number, title = split_heading(heading)
+    return {
+        'level': level,
+        'heading': heading,
+        'number': number,
+        'title': title,
+        'tables': [],
+    }
+
+
+def parse_markdown(text):
+    """Markdown 텍스트를 문서 모델로 변환
+
+    반환값: {'title', 'version', 'sections': [{'level', 'heading', 'number',
+    'title', 'tables': [{'header': [...], 'rows': [[...], ...]}]}]}
+    헤딩 이전에 나오는 테이블은 level 0 섹션에 담는다.
+    """
+    document = {'title': '', 'version': '', 'sections': []}
+    current = new_section(0, '')
+    document['sections'].append(current)
+
+    lines = text.splitlines()
+    in_code = False
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        stripped = line.strip()
+
+        # 코드 블록 내부는 무시
+        if stripped.startswith('```'):
+            in_code = not in_code
+            i += 1
+            continue
+        if in_code:
+            i += 1
+            continue
+
+        heading = HEADING_RE.match(stripped)
+        if heading:
+            level = len(heading.group(1))
+            current = new_section(level, heading.group(2))
+            document['sections'].append(current)
+            if level == 1 and not document['title']:
+                document['title'] = current['heading']
+            i += 1
+            continue
+
+        version = VERSION_RE.match(stripped)
+        if version and not document['version']:
+            document['version'] = version.group(1)
+
+        # 테이블: 헤더 행 + 구분선 행 + 본문 행
+        if (stripped.startswith('|') and i + 1 < len(lines)
+                and SEPARATOR_RE.match(lines[i + 1].strip())):
+            header = split_cells(stripped)
+            rows = []
+            i += 2
+            while i < len(lines) and lines[i].strip().startswith('|'):
+                cells = split_cells(lines[i])
+                # 열 수를 헤더에 맞춤
+                if len(cells) < len(header):
+                    cells += [''] * (len(header) - len(cells))
+                rows.append(cells[:len(header)])
+                i += 1
+            current['tables'].append({'header': header, 'rows': rows})
+            continue
+
+        i += 1
+
+    return document
+
+
+def parse_file(path):
+    """Markdown 파일을 읽어 문서 모델로 변환"""
+    with open(path, encoding='utf-8') as f:
+        return parse_markdown(f.read())
+
+
+# create_pdf.py 스타일 → 헤딩 레벨 (Markdown ## / ### 대응)
+SCRIPT_HEADING_LEVELS = {'DocTitle': 1, 'SectionTitle': 2, 'SubsectionTitle': 3}
+
+
+def parse_script(source):
+    """create_pdf.py 스타일 스크립트의 하드코딩 헤딩/테이블을 문서 모델로 변환
+
+    Paragraph(텍스트, styles[...]) 호출을 헤딩으로, 문자열 2차원 리스트 대입을
+    테이블로 보고 소스 순서대로 섹션을 구성한다. 표지 부제목의 "버전 X"는
+    version으로 읽는다. 스크립트는 실행하지 않는다.
+    """
+    document = {'title': '', 'version': '', 'sections': []}
+    current = new_section(0, '')
+    document['sections'].append(current)
+
+    items = []
+    for node in ast.walk(ast.parse(source)):
+        if (isinstance(node, ast.Call) and getattr(node.func, 'id', None) == 'Paragraph'
+                and len(node.args) >= 2 and isinstance(node.args[0], ast.Constant)
+                and isinstance(node.args[0].value, str)
+                and isinstance(node.args[1], ast.Subscript)):
+            style = node.args[1].slice
+            if isinstance(style, ast.Constant) and style.value in SCRIPT_HEADING_LEVELS:
+                items.append((node.lineno, node.col_offset, 'heading',
+                              (SCRIPT_HEADING_LEVELS[style.value], node.args[0].value)))
+            elif isinstance(style, ast.Constant) and style.value == 'DocSubtitle':
+                # 표지 부제목의 "버전 X" 표기
+                version = SCRIPT_VERSION_RE.match(node.args[0].value.strip())
+                if version:
+                    items.append((node.lineno, node.col_offset, 'version', version.group(1)))
+        elif isinstance(node, ast.Assign) and isinstance(node.value, ast.List):
+            try:
+                value = ast.literal_eval(node.value)
+            except ValueError:
+                continue
+            if value and all(isinstance(row, list) and all(isinstance(cell, str) for cell in row)
+                             for row in value):
+                items.append((node.lineno, node.col_offset, 'table', value))
+
+    for _, _, kind, value in sorted(items, key=lambda item: item[:2]):
+        if kind == 'version':
+            if not document['version']:
+                document['version'] = value
+        elif kind == 'heading':
+            level, heading = value
+            current = new_section(level, heading)
+            document['sections'].append(current)
+            if level == 1 and not document['title']:
+                document['title'] = heading
+        else:
+            header = value[0]
+            rows = [row[:len(header)] + [''] * (len(header) - len(row)) for row in value[1:]]
+            current['tables'].append({'header': header, 'rows': rows})
+
+    return document
+
+
+def tree_depth(line):
+    """트리 라인의 들여쓰기 깊이 (├/└ 위치, 트리 항목이 아니면 -1)"""
+    for index, char in enumerate(line):
+        if char in '├└':
+            return index
+    return -1
+
+
+def parse_code_enums(text):
+    """코드 블록 데이터 스키마에서 열거형(E 접두사 타입) 정의 추출
+
+    `Side (EGridSide: Ally / Enemy)` 같은 인라인 정의와
+    하위 트리 항목(`├── Haste (가속)`)으로 나열된 정의를 모두 지원한다.
+    반환값: [{'name', 'field', 'values': [(값, 설명), ...]}, ...]
+    """
+    enums = []
+    lines = text.splitlines()
+    in_code = False
+    for i, line in enumerate(lines):
+        if line.strip().startswith('```'):
+            in_code = not in_code
+            continue
+        if not in_code:
+            continue
+        match = ENUM_FIELD_RE.search(line)
+        if not match:
+            continue
+
+        field, name, inline = match.groups()
+        values = []
+        if inline:
+            values = [(value.strip(), '') for value in inline.split('/') if value.strip()]
+        else:
+            depth = tree_depth(line)
+            for child in lines[i + 1:]:
+                if child.strip().startswith('```'):
+                    break
+                child_depth = tree_depth(child)
+                if child_depth <= depth:
+                    break
+                item = TREE_ITEM_RE.search(child)
+                if child_depth == depth + 4 and item:
+                    values.append((item.group(1), item.group(2) or ''))
+        enums.append({'name': name, 'field': field, 'values': values})
+    return enums
+
+
+def key_index(header):
+    """테이블 키 컬럼 인덱스"""
+    if KEY_COLUMN in header:
+        return header.index(KEY_COLUMN)
+    return 0
+
+
+def iter_tables(document):
+    """(섹션, 테이블) 쌍 순회"""
+    for section in document['sections']:
+        for table in section['tables']:
+            yield section, table
@@ -0,0 +1,633 @@
+# -*- coding: utf-8 -*-
+"""
+챕터 진행 몬테카를로 런 시뮬레이터
+노드맵_이벤트_시스템_기획서 수치 기반으로 신뢰도/정신 오염도/파편/기억 분포 측정
+사용법: python run_simulator.py [런 수] [워커 수] [시드] [챕터 목록(예: 1,2)] [출력 PDF]
+"""
+
+import hashlib
+import math
+import os
+import random
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+# 리포트 스타일 재사용 (01_Combat/create_pdf.py)
+COMBAT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '01_Combat')
+if COMBAT_DIR not in sys.path:
+    sys.path.append(COMBAT_DIR)
+
+# ===== 이벤트 수치 (노드맵_이벤트_시스템_기획서) =====
+
+# 2.1 대분류 빈도 (안전지대는 고정 노드로 처리)
+EVENT_CATEGORY_WEIGHTS = {'성장': 15, '스토리': 20, '비전투': 40}
+
+# 2.2 희귀도 체계 → 8.1 이벤트 리스크
+RARITY_WEIGHTS = {'일반': 60, '희귀': 30, '전설': 8, '고유': 2}
+RARITY_RISK = {'일반': '저위험', '희귀': '중위험', '전설': '고위험', '고유': '고위험'}
+
+# 8.1 이벤트 보상 밸런스 (파편 조각, 파편 코어 1개 = 조각 10개)
+FRAGMENT_REWARD = {
+    '무위험': (3, 5),
+    '저위험': (5, 10),
+    '중위험': (15, 25),
+    '고위험': (10, 10),
+}
+
+# 2.3 정신 오염도 변형 확률 (상한, 확률)
+CORRUPTION_VARIANT = [(20, 0.0), (40, 0.10), (60, 0.25), (80, 0.50), (100, 0.75)]
+
+# 5.3.2 도박 결과 확률 (상한, [대성공, 성공, 실패, 대실패])
+GAMBLE_TABLE = [
+    (40, [30, 40, 20, 10]),
+    (60, [25, 35, 25, 15]),
+    (80, [20, 30, 30, 20]),
+    (100, [15, 25, 30, 30]),
+]
+GAMBLE_OUTCOMES = ['대성공', '성공', '실패', '대실패']
+
+# 8.2 정신 오염도 변동 가이드라인 (안전지대 행동은 6장 고정 수치 사용)
+CORRUPTION_DELTA = {
+    '외우주 지식': (3, 10),
+    '외우주 접촉': (5, 15),
+    '외우주 힘': (10, 20),
+    '유대': (-5, -2),
+}
+
+# 8.3 신뢰도 변동 가이드라인
+TRUST_DELTA = {
+    '호의적 대화': (1, 3),
+    '긍정적 선택': (3, 8),
+    '기억 공유': (5, 10),
+    '부정적 대화': (-3, -1),
+    '부정적 선택': (-10, -3),
+    '전투 중 보호': (2, 2),
+    '전투 중 방치': (-2, -2),
+}
+
+# 9.1.2 / 9.1.3 파티원 희귀 이벤트 (단계: 신뢰도 요구, 신뢰도 증가, 파편 조각)
+RARE_BASE_CHANCE = 0.05
+RARE_TRUST_BONUS = [(30, 0.02), (60, 0.03)]
+RARE_PHASES = [(10, 5, 10), (25, 8, 0), (40, 10, 0), (55, 12, 0), (70, 15, 0)]
+RARE_LATE_PHASE_CHAPTER = 4     # 4~5단계는 4장 이후
+
+# 4.1.2 신뢰도 단계 (기억 공유 선택지 해금 기준)
+TRUST_MEMORY_THRESHOLD = 30
+
+# ===== 챕터 노드맵 (챕터1/챕터2 상세기획서) =====
+# 층(layer)마다 (지역, 노드 타입 후보) 분기 중 하나를 선택한다.
+# 희귀 이벤트 지역(9.1.4)은 챕터 기본값을 쓰되, 지역명이 9.1.4 지역으로
+# 시작하면 해당 지역을 따른다 (예: 1장 검은 숲 구역).
+# 1장 동행 파티원은 확정 전이므로 캐릭터 상세기획서의 에르나/카이렌으로 가정한다.
+
+CHAPTERS = {
+    1: {
+        'title': '챕터1 로렌 영토',
+        'companions': ['에르나', '카이렌'],
+        'rare_region': '안개의 경계',
+        'layers': [
+            [('검은 숲 외곽', ['battle', 'event'])],
+            [('검은 숲 오염 지대', ['battle', 'event', 'treasure']), ('폐허 마을', ['event', 'shop', 'rest'])],
+            [('오염된 하천', ['event', 'battle', 'treasure']), ('로렌 가도', ['event', 'rest', 'battle'])],
+            [('검은 숲 심층부', ['battle', 'event', 'story'])],
+            [('로렌 성채 외벽', ['rest', 'shop', 'temple'])],
+            [('로렌 성채 내부', ['story', 'event', 'battle'])],
+            [('타락한 로렌 영주', ['boss'])],
+        ],
+    },
+    2: {
+        'title': '챕터2 잿빛 폐허',
+        'companions': ['에르나', '카이렌', '엘리아스'],
+        'rare_region': '잿빛 폐허',
+        'layers': [
+            [('잿빛 평원', ['battle'])],
+            [('폐허 레헨탈 마을', ['event', 'shop', 'rest']), ('원정대 기념비', ['event', 'treasure'])],
+            [('원정대 야영지 터', ['story', 'event', 'rest'])],
+            [('기록 보관소', ['story', 'event']), ('성채 외곽', ['battle', 'treasure'])],
+            [('레헨탈 성채 입구', ['rest', 'temple', 'shop'])],
+            [('레헨탈 성채', ['battle', 'event'])],
+            [('타락한 레헨탈 수호자', ['boss'])],
+        ],
+    },
+}
+
+# 9.1.4 지역별 파티원 희귀 이벤트 발생 노드 타입
+RARE_EVENT_NODES = {
+    '안개의 경계': {'event'},
+    '잿빛 폐허': {'rest', 'event'},
+    '검은 숲': {'event', 'battle'},
+    '봉인의 신전': {'temple', 'story'},
+    '태초의 던전': {'story', 'boss'},
+}
+
+# 시뮬레이션 분할 단위 (워커 수와 무관하게 고정, 병합 순서 재현)
+RUNS_PER_CHUNK = 500
+
+# 6.1.1 기본 상점 항목 (파편 조각)
+# 오염 변형이 시작되는 구간(2.3, 21 이상)이면 오염도 감소를, 아니면 일반 카드를 산다.
+SHOP_CARD_PRICE = (30, 50)
+SHOP_PURIFY_PRICE = 40
+SHOP_PURIFY_AMOUNT = -10
+SHOP_PURIFY_THRESHOLD = 20
+
+# 6.2.1 휴식 노드: 명상 + 대화
+REST_MEDITATION_AMOUNT = -10
+
+# 6.3.1 신전 정화 (정신 오염도 -30, 금화 200)
+# 3~8장에 금화 획득 수치가 없어 금화는 시뮬레이션하지 않으며,
+# 오염도가 있으면 방문 시 항상 정화한다 (정화율 = 오염 상태 신전 방문율).
+TEMPLE_PURIFY_AMOUNT = -30
+
+# 분포 구간 (지표: (최소, 최대, 구간 폭))
+HISTOGRAM_RANGE = {
+    'corruption': (0, 100, 10),
+    'trust': (0, 100, 10),
+    'fragments': (0, 200, 20),
+    'memory': (0, 10, 1),
+}
+
+
+class RunningStat:
+    """스트리밍 통계 (Welford 평균/분산 + 고정 구간 히스토그램), 병합 가능"""
+
+    __slots__ = ('count', 'mean', 'm2', 'minimum', 'maximum', 'low', 'high', 'width', 'bins')
+
+    def __init__(self, low, high, width):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self.low = low
+        self.high = high
+        self.width = width
+        self.bins = [0] * (int(math.ceil((high - low) / width)) + 1)
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+        index = int((min(max(value, self.low), self.high) - self.low) // self.width)
+        self.bins[min(index, len(self.bins) - 1)] += 1
+
+    def merge(self, other):
+        """병렬 분산 병합 (Chan et al.)"""
+        if other.count == 0:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        self.bins = [a + b for a, b in zip(self.bins, other.bins)]
+
+    def stdev(self):
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+    def percentile(self, fraction):
+        """히스토그램 기반 근사 백분위 (구간 하한값)"""
+        target = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.bins):
+            seen += count
+            if seen >= target and count:
+                return self.low + index * self.width
+        return self.high
+
+
+def derive_seed(seed, *keys):
+    """기준 시드와 키로부터 독립 난수 스트림 시드 생성"""
+    payload = ':'.join(str(key) for key in (seed,) + keys).encode('utf-8')
+    return int.from_bytes(hashlib.blake2b(payload, digest_size=8).digest(), 'little')
+
+
+def clamp(value, low=0, high=100):
+    """범위 제한"""
+    return max(low, min(high, value))
+
+
+def pick_weighted(rng, weights):
+    """가중치 딕셔너리에서 키 추첨"""
+    return rng.choices(list(weights), weights=list(weights.values()))[0]
+
+
+def lookup_band(table, value):
+    """(상한, 값) 구간 테이블 조회"""
+    for upper, result in table:
+        if value <= upper:
+            return result
+    return table[-1][1]
+
+
+# ===== 런 상태 / 노드 처리 =====
+
+def new_run_state(companions):
+    """런 초기 상태"""
+    return {
+        'corruption': 0,
+        'fragments': 0,
+        'memory': 0,
+        'trust': {name: 0 for name in companions},
+        'rare_phase': {name: 0 for name in companions},
+        'hits': Counter(),
+    }
+
+
+def change_corruption(state, rng, kind):
+    low, high = CORRUPTION_DELTA[kind]
+    state['corruption'] = clamp(state['corruption'] + rng.randint(low, high))
+
+
+def shift_corruption(state, amount):
+    """고정 수치 오염도 변동 (안전지대 행동)"""
+    state['corruption'] = clamp(state['corruption'] + amount)
+
+
+def change_trust(state, rng, name, kind):
+    low, high = TRUST_DELTA[kind]
+    state['trust'][name] = clamp(state['trust'][name] + rng.randint(low, high))
+
+
+def gain_fragments(state, rng, risk):
+    low, high = FRAGMENT_REWARD[risk]
+    state['fragments'] += rng.randint(low, high)
+
+
+def resolve_event(state, rng, companions):
+    """❓ 이벤트 노드 (2.1 분류 → 2.2 희귀도 → 2.3 오염 변형)"""
+    hits = state['hits']
+    category = pick_weighted(rng, EVENT_CATEGORY_WEIGHTS)
+    rarity = pick_weighted(rng, RARITY_WEIGHTS)
+    risk = RARITY_RISK[rarity]
+    hits[f'이벤트:{category}'] += 1
+    hits[f'희귀도:{rarity}'] += 1
+
+    # 외우주 침식 변형: 숨겨진 외우주 선택지 수락
+    if rng.random() < lookup_band(CORRUPTION_VARIANT, state['corruption']):
+        hits['오염 변형'] += 1
+        change_corruption(state, rng, '외우주 지식')
+        gain_fragments(state, rng, risk)
+        return
+
+    if category == '성장':
+        gain_fragments(state, rng, risk)
+
+    elif category == '스토리':
+        name = rng.choice(companions)
+        if rng.random() < 0.75:
+            change_trust(state, rng, name, '긍정적 선택')
+        else:
+            change_trust(state, rng, name, '부정적 선택')
+        # 4.2 관계 파편: 신뢰 단계 이상 원정대원과 기억 공유
+        if state['trust'][name] >= TRUST_MEMORY_THRESHOLD:
+            hits['기억 공유'] += 1
+            change_trust(state, rng, name, '기억 공유')
+            state['memory'] += 1
+
+    else:
+        kind = rng.choice(['자원', '도박', '외우주', '파티'])
+        hits[f'비전투:{kind}'] += 1
+        if kind == '자원':
+            gain_fragments(state, rng, '무위험')
+        elif kind == '도박':
+            weights = lookup_band(GAMBLE_TABLE, state['corruption'])
+            outcome = rng.choices(GAMBLE_OUTCOMES, weights=weights)[0]
+            hits[f'도박:{outcome}'] += 1
+            if outcome == '대성공':
+                gain_fragments(state, rng, '중위험')
+            elif outcome == '성공':
+                gain_fragments(state, rng, '저위험')
+            elif outcome == '실패':
+                state['fragments'] = max(0, state['fragments'] - 5)
+            else:
+                state['fragments'] = max(0, state['fragments'] - 10)
+                change_corruption(state, rng, '외우주 접촉')
+        elif kind == '외우주':
+            change_corruption(state, rng, '외우주 지식')
+            gain_fragments(state, rng, risk)
+        else:
+            for name in companions:
+                change_trust(state, rng, name, '호의적 대화')
+            change_corruption(state, rng, '유대')
+
+
+def resolve_rare_event(state, rng, companions, chapter):
+    """9.1 파티원 희귀 이벤트 (파티원별 단계 진행)"""
+    for name in companions:
+        phase = state['rare_phase'][name]
+        if phase >= len(RARE_PHASES):
+            continue
+        if phase + 1 >= RARE_LATE_PHASE_CHAPTER and chapter < RARE_LATE_PHASE_CHAPTER:
+            continue
+        requirement, gain, fragments = RARE_PHASES[phase]
+        trust = state['trust'][name]
+        if trust < requirement:
+            continue
+        chance = RARE_BASE_CHANCE + sum(bonus for threshold, bonus in RARE_TRUST_BONUS if trust >= threshold)
+        if rng.random() < chance:
+            state['rare_phase'][name] = phase + 1
+            state['trust'][name] = clamp(trust + gain)
+            state['fragments'] += fragments
+            state['hits'][f'희귀:{phase + 1}단계'] += 1
+            if phase + 1 == len(RARE_PHASES):
+                state['memory'] += 1
+            return
+
+
+def rare_region(chapter, area):
+    """노드 지역의 희귀 이벤트 지역 (9.1.4)"""
+    for region in RARE_EVENT_NODES:
+        if area.startswith(region):
+            return region
+    return CHAPTERS[chapter]['rare_region']
+
+
+def resolve_node(state, rng, node_type, companions, chapter, area):
+    """노드 진입 처리 (1.2 이벤트 발생 구조)"""
+    hits = state['hits']
+    hits[f'노드:{node_type}'] += 1
+
+    if node_type == 'battle':
+        gain_fragments(state, rng, '무위험')
+        name = rng.choice(companions)
+        roll = rng.random()
+        if roll < 0.15:
+            change_trust(state, rng, name, '전투 중 보호')
+        elif roll < 0.30:
+            change_trust(state, rng, name, '전투 중 방치')
+
+    elif node_type == 'event':
+        resolve_event(state, rng, companions)
+
+    elif node_type == 'rest':
+        shift_corruption(state, REST_MEDITATION_AMOUNT)
+        for name in companions:
+            change_trust(state, rng, name, '호의적 대화')
+
+    elif node_type == 'shop':
+        card_price = rng.randint(*SHOP_CARD_PRICE)
+        if state['corruption'] > SHOP_PURIFY_THRESHOLD and state['fragments'] >= SHOP_PURIFY_PRICE:
+            state['fragments'] -= SHOP_PURIFY_PRICE
+            shift_corruption(state, SHOP_PURIFY_AMOUNT)
+            hits['상점:오염도 감소'] += 1
+        elif state['fragments'] >= card_price:
+            state['fragments'] -= card_price
+            hits['상점:일반 카드'] += 1
+
+    elif node_type == 'temple':
+        if state['corruption'] > 0:
+            shift_corruption(state, TEMPLE_PURIFY_AMOUNT)
+            hits['신전 정화'] += 1
+
+    elif node_type == 'treasure':
+        gain_fragments(state, rng, '저위험')
+        if rng.random() < 0.10:
+            hits['보물 저주'] += 1
+            change_corruption(state, rng, '외우주 접촉')
+
+    elif node_type == 'story':
+        state['memory'] += 1       # 정체성 파편
+
+    elif node_type == 'boss':
+        change_corruption(state, rng, '외우주 접촉')
+        state['memory'] += 1       # 원정대 기억 파편 (보스 드롭)
+
+    if node_type in RARE_EVENT_NODES[rare_region(chapter, area)]:
+        resolve_rare_event(state, rng, companions, chapter)
+
+
+def simulate_run(rng, chapters):
+    """챕터 목록을 순서대로 진행하는 1회 런, 챕터별 종료 오염도 포함 최종 상태 반환"""
+    companions = []
+    state = None
+    chapter_corruption = []
+    for chapter in chapters:
+        config = CHAPTERS[chapter]
+        for name in config['companions']:
+            if name not in companions:
+                companions.append(name)
+        if state is None:
+            state = new_run_state(companions)
+        for name in companions:
+            state['trust'].setdefault(name, 0)
+            state['rare_phase'].setdefault(name, 0)
+
+        for layer in config['layers']:
+            area, candidates = rng.choice(layer)
+            resolve_node(state, rng, rng.choice(candidates), companions, chapter, area)
+        chapter_corruption.append(state['corruption'])
+
+    state['chapter_corruption'] = chapter_corruption
+    return state
+
+
+# ===== 배치 / 병렬 실행 =====
+
+def new_metric(kind):
+    return RunningStat(*HISTOGRAM_RANGE[kind])
+
+
+def new_aggregate():
+    """워커별 집계 (런 단위 트레이스는 보관하지 않음)"""
+    return {
+        'runs': 0,
+        'metrics': {},
+        'hit_totals': Counter(),
+        'hit_runs': Counter(),
+    }
+
+
+def add_metric(aggregate, name, kind, value):
+    metric = aggregate['metrics'].get(name)
+    if metric is None:
+        metric = aggregate['metrics'][name] = new_metric(kind)
+    metric.add(value)
+
+
+def record_run(aggregate, chapters, state):
+    aggregate['runs'] += 1
+    add_metric(aggregate, '최종 정신 오염도', 'corruption', state['corruption'])
+    for chapter, value in zip(chapters, state['chapter_corruption']):
+        add_metric(aggregate, f'{chapter}장 종료 오염도', 'corruption', value)
+    add_metric(aggregate, '파편 조각', 'fragments', state['fragments'])
+    add_metric(aggregate, '기억 진행도', 'memory', state['memory'])
+    for name, trust in state['trust'].items():
+        add_metric(aggregate, f'신뢰도: {name}', 'trust', trust)
+    aggregate['hit_totals'].update(state['hits'])
+    aggregate['hit_runs'].update(state['hits'].keys())
+
+
+def merge_aggregate(target, source):
+    target['runs'] += source['runs']
+    for name, metric in source['metrics'].items():
+        if name in target['metrics']:
+            target['metrics'][name].merge(metric)
+        else:
+            target['metrics'][name] = metric
+    target['hit_totals'].update(source['hit_totals'])
+    target['hit_runs'].update(source['hit_runs'])
+
+
+def simulate_batch(args):
+    """워커 실행 단위: [start, stop) 구간 런 시뮬레이션
+
+    런마다 (시드, 런 번호)로 난수 스트림을 파생하므로 워커 수/분할과 무관하게 재현된다.
+    """
+    seed, chapters, start, stop = args
+    aggregate = new_aggregate()
+    for run_index in range(start, stop):
+        rng = random.Random(derive_seed(seed, run_index))
+        record_run(aggregate, chapters, simulate_run(rng, chapters))
+    return aggregate
+
+
+def validate_options(runs, chapters):
+    """런 수/챕터 번호 검사"""
+    unknown = [chapter for chapter in chapters if chapter not in CHAPTERS]
+    if unknown:
+        raise ValueError(f"알 수 없는 챕터: {unknown} (지원: {sorted(CHAPTERS)})")
+    if runs < 0:
+        raise ValueError(f"런 수는 0 이상이어야 합니다: {runs}")
+
+
+def run_simulation(runs, chapters=(1, 2), seed=0, workers=None):
+    """프로세스 풀로 runs회 런을 실행하고 병합된 집계 반환
+
+    런을 RUNS_PER_CHUNK 단위로 고정 분할하므로 워커 수와 무관하게 결과가 같다.
+    """
+    chapters = tuple(chapters)
+    validate_options(runs, chapters)
+    workers = workers or os.cpu_count() or 1
+    tasks = [(seed, chapters, start, min(start + RUNS_PER_CHUNK, runs))
+             for start in range(0, runs, RUNS_PER_CHUNK)]
+
+    result = new_aggregate()
+    if workers == 1:
+        batches = map(simulate_batch, tasks)
+        for batch in batches:
+            merge_aggregate(result, batch)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # 순서 보존 병합 (부동소수 결과 재현)
+            for batch in executor.map(simulate_batch, tasks):
+                merge_aggregate(result, batch)
+    result['seed'] = seed
+    result['chapters'] = chapters
+    return result
+
+
+# ===== 리포트 =====
+
+def format_number(value):
+    return f'{value:.1f}'
+
+
+def ratio(count, runs):
+    """런 수 대비 비율 (런이 없으면 0)"""
+    return count / runs if runs else 0.0
+
+
+def build_report(result, output_path):
+    """시뮬레이션 결과 PDF 생성 (create_pdf.py 스타일)"""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import cm
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
+    from create_pdf import create_styles, create_table
+
+    doc = SimpleDocTemplate(
+        output_path,
+        pagesize=A4,
+        rightMargin=1.5*cm,
+        leftMargin=1.5*cm,
+        topMargin=2*cm,
+        bottomMargin=2*cm
+    )
+
+    styles = create_styles()
+    story = []
+    runs = result['runs']
+    chapter_titles = ' → '.join(CHAPTERS[chapter]['title'] for chapter in result['chapters'])
+
+    # ===== 표지 =====
+    story.append(Spacer(1, 3*cm))
+    story.append(Paragraph("챕터 진행 시뮬레이션 리포트", styles['DocTitle']))
+    story.append(Spacer(1, 1*cm))
+    story.append(Paragraph(chapter_titles, styles['DocSubtitle']))
+    story.append(Paragraph(f"런 수: {runs:,} / 시드: {result['seed']}", styles['DocSubtitle']))
+
+    # ===== 1. 지표 요약 =====
+    story.append(PageBreak())
+    story.append(Paragraph("1. 지표 요약", styles['SectionTitle']))
+    data = [['지표', '평균', '표준편차', '최소~최대', '중앙값(근사)']]
+    for name, metric in result['metrics'].items():
+        data.append([name, format_number(metric.mean), format_number(metric.stdev()),
+                     f'{metric.minimum:g}~{metric.maximum:g}', f'{metric.percentile(0.5):g}'])
+    story.append(create_table(data))
+
+    # ===== 2. 분포 =====
+    story.append(Paragraph("2. 분포", styles['SectionTitle']))
+    for name, metric in result['metrics'].items():
+        story.append(Paragraph(name, styles['SubsectionTitle']))
+        data = [['구간', '런 수', '비율', '누적 비율', '참조']]
+        cumulative = 0
+        for index, count in enumerate(metric.bins):
+            if not count:
+                continue
+            cumulative += count
+            start = metric.low + index * metric.width
+            label = f'{start}~{start + metric.width - 1}' if metric.width > 1 else f'{start}'
+            if start >= metric.high:
+                label = f'{metric.high}+'
+            data.append([label, f'{count:,}', f'{ratio(count, runs):.1%}', f'{ratio(cumulative, runs):.1%}',
+                         '노드맵_이벤트 8장'])
+        story.append(create_table(data))
+
+    # ===== 3. 이벤트 발생률 =====
+    story.append(PageBreak())
+    story.append(Paragraph("3. 이벤트 발생률", styles['SectionTitle']))
+    data = [['이벤트', '런당 평균', '발생 런 비율', '총 발생', '분류']]
+    for key in sorted(result['hit_totals']):
+        group, _, label = key.partition(':')
+        data.append([label or group, f"{ratio(result['hit_totals'][key], runs):.2f}",
+                     f"{ratio(result['hit_runs'][key], runs):.1%}", f"{result['hit_totals'][key]:,}",
+                     group if label else '-'])
+    story.append(create_table(data))
+
+    # PDF 빌드
+    doc.build(story)
+    print(f"PDF 생성 완료: {output_path}")
+    return output_path
+
+
+def main(argv):
+    if len(argv) > 5:
+        output_path = argv[5]
+    else:
+        output_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "챕터_진행_시뮬레이션_리포트.pdf")
+
+    try:
+        runs = int(argv[1]) if len(argv) > 1 else 10000
+        workers = int(argv[2]) if len(argv) > 2 else None
+        seed = int(argv[3]) if len(argv) > 3 else 0
+        chapters = [int(c) for c in argv[4].split(',')] if len(argv) > 4 else [1, 2]
+        validate_options(runs, chapters)
+    except ValueError as error:
+        print(error)
+        print(__doc__)
+        return 1
+
+    result = run_simulation(runs, chapters, seed, workers)
+    for name, metric in result['metrics'].items():
+        print(f"{name}: 평균 {metric.mean:.1f}, 표준편차 {metric.stdev():.1f}")
+    build_report(result, output_path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))